@@ -0,0 +1,88 @@
+import os
+from typing import List
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+
+# Constants
+_DIVIDEND_DIR = "dividend_stocks"
+_OUTPUT_FILE = "dividends.parquet"
+# Amounts are read as strings since they include the currency sign (e.g. "$0.26")
+_CONVERT_OPTIONS = pv.ConvertOptions(
+    column_types={"Ex-Dividend Date": pa.string(), "Amount": pa.string()},
+    include_columns=["Ex-Dividend Date", "Amount"],
+)
+_SCHEMA = pa.schema([
+    ("Symbol", pa.dictionary(pa.int32(), pa.string())),
+    ("Date", pa.date32()),
+    ("Amount", pa.float64()),
+    # The amount as published, so the dashboard shows "N/A" or "$1,234.50" verbatim
+    ("Amount Text", pa.dictionary(pa.int32(), pa.string())),
+])
+
+def _list_csv_entries() -> List[os.DirEntry]:
+    """Lists the CSV files in the dividend directory."""
+    with os.scandir(_DIVIDEND_DIR) as entries:
+        return [entry for entry in entries if entry.name.endswith(".csv")]
+
+def _is_stale() -> bool:
+    """Checks whether the output file is missing or older than any dividend file."""
+    if not os.path.exists(_OUTPUT_FILE):
+        return True
+    # Files written with an older set of columns are rebuilt
+    if not pq.read_schema(_OUTPUT_FILE).equals(_SCHEMA):
+        return True
+    output_mtime = os.path.getmtime(_OUTPUT_FILE)
+    # The directory itself changes when files are removed
+    mtimes = [entry.stat().st_mtime for entry in _list_csv_entries()]
+    mtimes.append(os.path.getmtime(_DIVIDEND_DIR))
+    return max(mtimes) >= output_mtime
+
+def _read_dividend_file(entry: os.DirEntry) -> pd.DataFrame:
+    """Reads the raw dividend rows of a file, tagged with its symbol."""
+    symbol = os.path.splitext(entry.name)[0]
+    try:
+        table = pv.read_csv(entry.path, convert_options=_CONVERT_OPTIONS)
+    except pa.ArrowKeyError:
+        # The file lacks the dividend columns
+        return pd.DataFrame()
+    except (OSError, pa.ArrowInvalid) as e:
+        print(f"Error processing {symbol}: {e}")
+        return pd.DataFrame()
+    return table.to_pandas(types_mapper=pd.ArrowDtype).assign(Symbol=symbol)
+
+def _to_table(raw: pd.DataFrame) -> pa.Table:
+    """Converts raw dividend rows to the typed columnar layout."""
+    dates = pd.to_datetime(raw["Ex-Dividend Date"], format="%m/%d/%Y", errors="coerce", cache=True)
+    amounts = raw["Amount"].str.lstrip("$").str.replace(",", "")
+    df = pd.DataFrame({
+        "Symbol": raw["Symbol"].astype("category"),
+        "Date": dates.dt.date,
+        "Amount": pd.to_numeric(amounts, errors="coerce").astype("float64"),
+        "Amount Text": raw["Amount"].astype("category"),
+    })
+    # Rows without a valid date are never shown
+    df = df[dates.notna()]
+    return pa.Table.from_pandas(df, schema=_SCHEMA, preserve_index=False)
+
+def build_dividends() -> None:
+    """Consolidates the per-symbol dividend files into a single Parquet file."""
+    if not os.path.exists(_DIVIDEND_DIR):
+        print(f"Directory {_DIVIDEND_DIR} does not exist.")
+        return
+    if not _is_stale():
+        return
+
+    frames = [frame for frame in map(_read_dividend_file, _list_csv_entries()) if not frame.empty]
+    if not frames:
+        print("No dividend data to consolidate.")
+        return
+
+    table = _to_table(pd.concat(frames, ignore_index=True))
+    pq.write_table(table, _OUTPUT_FILE, compression="zstd")
+    print(f"Successfully wrote {table.num_rows} dividends to {_OUTPUT_FILE}")
+
+if __name__ == "__main__":
+    build_dividends()
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+
+from yearly_dividend import consistent_yearly_counts
+
+# Constants
+_TOOLTIP_HEADER = "| Date | Amount |\n|---|---|\n"
+
+def _format_tooltip_rows(div_df: pd.DataFrame) -> pd.Series:
+    """Formats each dividend as a markdown table row."""
+    dates = div_df["Date"].dt.strftime("%Y-%m-%d")
+    amounts = div_df["Amount Text"].astype(str)
+    return "| " + dates + " | " + amounts + " |\n"
+
+def generate_tooltips(history: pd.DataFrame, start_year: int) -> pd.Series:
+    """Generates the tooltip of every symbol, listing dividends since start_year."""
+    recent = history[history["Year"] >= start_year]
+    recent = recent.sort_values(["Symbol", "Date"], ascending=[True, False])
+    symbols = history["Symbol"].unique()
+    if recent.empty:
+        return pd.Series(_TOOLTIP_HEADER, index=symbols)
+
+    rows = _format_tooltip_rows(recent).groupby(recent["Symbol"], observed=True).agg("".join)
+    tooltips = _TOOLTIP_HEADER + rows
+    return tooltips.reindex(symbols, fill_value=_TOOLTIP_HEADER)
+
+def calculate_yearly_dividends(history: pd.DataFrame, start_year: int) -> pd.Series:
+    """Calculates the consistent yearly dividend count of every symbol since start_year."""
+    period = history[history["Year"] >= start_year]
+    if period.empty:
+        return pd.Series(dtype=str)
+
+    codes, symbols = pd.factorize(period["Symbol"], sort=True)
+    years = period["Year"].to_numpy()
+    order = np.lexsort((years, codes))
+    codes, years = codes[order], years[order]
+    starts = np.flatnonzero(np.diff(codes, prepend=-1, append=-1))
+
+    counts = pd.Series(consistent_yearly_counts(starts, years), index=symbols)
+    return counts.astype(str).where(counts >= 0, "-")
+
+def format_market_caps(market_caps: pd.Series) -> pd.Series:
+    """Formats market caps to whole Billions, leaving missing values blank."""
+    formatted = (market_caps / 1_000_000_000).round().astype("Int64").astype("string")
+    return formatted.fillna("")
@@ -0,0 +1,122 @@
+import functools
+import os
+from datetime import datetime
+from typing import Optional, Set
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from build_dividends import build_dividends
+from dashboard_columns import calculate_yearly_dividends, format_market_caps, generate_tooltips
+
+# Constants
+_DIVIDEND_SYMBOLS_FILE = "all_dividend_symbols.txt"
+_ALL_SYMBOLS_FILE = "all_symbols.csv"
+_DIVIDENDS_FILE = "dividends.parquet"
+_CACHE_FILE = "dashboard_cache.parquet"
+
+def _mtime(path: str) -> Optional[float]:
+    """Returns the modification time of a file, or None when it does not exist."""
+    try:
+        return os.path.getmtime(path)
+    except FileNotFoundError:
+        return None
+
+def _load_dividend_symbols() -> Set[str]:
+    """Loads dividend symbols from file, re-reading it whenever it changes."""
+    return _read_dividend_symbols(_mtime(_DIVIDEND_SYMBOLS_FILE))
+
+@functools.lru_cache(maxsize=1)
+def _read_dividend_symbols(mtime: Optional[float]) -> Set[str]:
+    """Parses the dividend symbols file; the modification time keys the cache."""
+    if mtime is None:
+        return set()
+    with open(_DIVIDEND_SYMBOLS_FILE, "r") as f:
+        # Handle both "Symbol" and "Symbol,Sector" formats
+        symbols = set()
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if "," in line:
+                symbols.add(line.split(",")[0])
+            else:
+                symbols.add(line)
+        return symbols
+
+def _load_all_symbols() -> pd.DataFrame:
+    """Loads all stock symbols from CSV, re-reading it whenever it changes."""
+    return _read_all_symbols(_mtime(_ALL_SYMBOLS_FILE))
+
+@functools.lru_cache(maxsize=1)
+def _read_all_symbols(mtime: Optional[float]) -> pd.DataFrame:
+    """Parses the symbols CSV; the modification time keys the cache."""
+    if mtime is None:
+        return pd.DataFrame()
+    return pd.read_csv(_ALL_SYMBOLS_FILE)
+
+def _load_dividend_history() -> pd.DataFrame:
+    """Reads the consolidated dividend history of all symbols."""
+    if not os.path.exists(_DIVIDENDS_FILE):
+        return pd.DataFrame(columns=["Symbol", "Date", "Amount", "Amount Text", "Year"])
+
+    history = pq.read_table(_DIVIDENDS_FILE).to_pandas(date_as_object=False)
+    # Years are used by every window; derive them once, packed into int16
+    history["Year"] = history["Date"].dt.year.astype("int16")
+    return history
+
+def _latest_input_mtime() -> float:
+    """Returns the most recent modification time among the dashboard inputs."""
+    mtimes = map(_mtime, (_ALL_SYMBOLS_FILE, _DIVIDEND_SYMBOLS_FILE, _DIVIDENDS_FILE))
+    return max((mtime for mtime in mtimes if mtime is not None), default=0.0)
+
+def _is_cache_fresh() -> bool:
+    """Checks whether the cached data is newer than all of its inputs."""
+    if not os.path.exists(_CACHE_FILE):
+        return False
+    cache_mtime = os.path.getmtime(_CACHE_FILE)
+    # The yearly windows are relative to the current year
+    if datetime.fromtimestamp(cache_mtime).year != datetime.now().year:
+        return False
+    return cache_mtime > _latest_input_mtime()
+
+def _build_data() -> pd.DataFrame:
+    """Loads and processes stock data from the symbol and dividend files."""
+    dividend_symbols = _load_dividend_symbols()
+    df = _load_all_symbols()
+    
+    if df.empty or not dividend_symbols:
+        return pd.DataFrame()
+        
+    dividend_df = pd.DataFrame({"Symbol": sorted(dividend_symbols)})
+    df = dividend_df.merge(df, on="Symbol", how="inner")
+    
+    history = _load_dividend_history()
+    # Yearly dividends cover the last 5 years, tooltips the last 10
+    current_year = datetime.now().year
+    yearly_dividends = calculate_yearly_dividends(history, current_year - 5)
+    tooltips = generate_tooltips(history, current_year - 10)
+    df["Yearly Dividend"] = df["Symbol"].map(yearly_dividends).fillna("-")
+    df["tooltip"] = df["Symbol"].map(tooltips).fillna("")
+    df["Market Cap Value"] = pd.to_numeric(df["Market Cap"], errors='coerce')
+    df["Market Cap"] = format_market_caps(df["Market Cap Value"])
+    
+    # Ensure Sector column exists (it should be in all_symbols.csv now)
+    if "Sector" not in df.columns:
+        df["Sector"] = "Unknown"
+
+    columns = ["Symbol", "Sector", "Market Cap", "Market Cap Value", "Yearly Dividend", "tooltip"]
+    return df[columns].reset_index(drop=True)
+
+def load_data() -> pd.DataFrame:
+    """Main function to load stock data, reusing the on-disk cache when fresh."""
+    build_dividends()
+    if _is_cache_fresh():
+        df = pd.read_parquet(_CACHE_FILE)
+    else:
+        df = _build_data()
+        if not df.empty:
+            df.to_parquet(_CACHE_FILE, compression="snappy")
+
+    print(f"Loaded {len(df)} stocks.")
+    return df
@@ -0,0 +1,34 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+# Columns of the per-symbol dividend CSV files, in extraction order
+FIELDNAMES = ["Ex-Dividend Date", "Type", "Amount", "Declaration Date", "Record Date", "Payment Date", "Currency"]
+
+def extract_dividends(data: Optional[Dict[str, Any]]) -> List[Tuple[Any, ...]]:
+    """
+    Extracts the dividend rows of a Nasdaq API response.
+
+    The module is plain annotated Python, so it can be compiled on its own
+    with `mypyc dividend_rows.py`; the compiled extension is picked up by the
+    same import. Field values stay `Any`, since the API sends nulls.
+
+    Args:
+        data: Decoded JSON body of the dividends endpoint, possibly null.
+
+    Returns:
+        One tuple per dividend, in FIELDNAMES order. Null fields stay None.
+    """
+    # Any level of the response may be missing or null
+    dividend_data = ((data or {}).get("data") or {}).get("dividends") or {}
+    rows: List[Dict[str, Any]] = dividend_data.get("rows") or []
+    return [
+        (
+            row.get("exOrEffDate", "N/A"),
+            row.get("type", "N/A"),
+            row.get("amount", "N/A"),
+            row.get("declarationDate", "N/A"),
+            row.get("recordDate", "N/A"),
+            row.get("paymentDate", "N/A"),
+            row.get("currency", "N/A"),
+        )
+        for row in rows
+    ]
@@ -1,8 +1,41 @@
 import os
+import concurrent.futures
+from typing import List, Optional, Tuple
+
+from dividend_rows import FIELDNAMES
 
 # Constants
 _DIVIDEND_DIR = "dividend_stocks"
 _OUTPUT_FILE = "all_dividend_symbols.txt"
+# Header line as csv.writer writes it, so header-only files are known by size alone
+_HEADER_SIZE = len(",".join(FIELDNAMES).encode()) + len("\r\n")
+_SIZE_MARGIN = 2
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+def _list_csv_entries() -> List[os.DirEntry]:
+    """Lists the CSV files in the dividend directory."""
+    with os.scandir(_DIVIDEND_DIR) as entries:
+        return [entry for entry in entries if entry.name.endswith(".csv")]
+
+def _has_dividend_rows(entry: os.DirEntry) -> bool:
+    """Checks whether a dividend file has more than just the header, using its size."""
+    size = entry.stat().st_size
+    if size == _HEADER_SIZE:
+        return False
+    if size > _HEADER_SIZE + _SIZE_MARGIN:
+        return True
+    # Other sizes, including empty or truncated files, need a look at the content
+    with open(entry.path, "rb") as f:
+        f.readline()
+        return bool(f.readline())
+
+def _probe(entry: os.DirEntry) -> Tuple[os.DirEntry, Optional[bool]]:
+    """Probes a dividend file, returning None instead of a result on read errors."""
+    try:
+        return entry, _has_dividend_rows(entry)
+    except OSError as e:
+        print(f"Error reading {entry.name}: {e}")
+        return entry, None
 
 def filter_dividend_stocks() -> None:
     """
@@ -18,23 +51,16 @@ def filter_dividend_stocks() -> None:
     files_to_remove = []
 
     print("Filtering dividend files...")
-    for filename in os.listdir(_DIVIDEND_DIR):
-        if not filename.endswith(".csv"):
-            continue
-
-        filepath = os.path.join(_DIVIDEND_DIR, filename)
-        symbol = os.path.splitext(filename)[0]
+    entries = _list_csv_entries()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        results = list(executor.map(_probe, entries))
 
-        try:
-            with open(filepath, "r") as f:
-                lines = f.readlines()
-                # Check if there is more than just the header
-                if len(lines) > 1:
-                    dividend_symbols.append(symbol)
-                else:
-                    files_to_remove.append(filepath)
-        except Exception as e:
-            print(f"Error reading {filename}: {e}")
+    for entry, has_rows in results:
+        # Check if there is more than just the header
+        if has_rows:
+            dividend_symbols.append(os.path.splitext(entry.name)[0])
+        elif has_rows is not None:
+            files_to_remove.append(entry.path)
 
     # Load sectors from all_symbols.csv
     symbol_sectors = {}
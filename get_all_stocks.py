@@ -1,21 +1,16 @@
 import csv
-import json
-import urllib.request
 from typing import List, Dict, Any
 
+from http_client import fetch_json
+
 # Constants
 _NASDAQ_API_URL = "https://api.nasdaq.com/api/screener/stocks?tableonly=true&limit=25&offset=0&download=true"
-_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36"
 _OUTPUT_FILENAME = "all_symbols.csv"
 _MIN_MARKET_CAP = 1_000_000_000
 
 def _fetch_stock_data() -> Dict[str, Any]:
     """Fetches stock data from the NASDAQ API."""
-    headers = {"User-Agent": _USER_AGENT}
-    req = urllib.request.Request(_NASDAQ_API_URL, headers=headers)
-    with urllib.request.urlopen(req) as response:
-        data = response.read()
-        return json.loads(data)
+    return fetch_json(_NASDAQ_API_URL)
 
 def _parse_market_cap(market_cap_str: str) -> float:
     """Parses market cap string to float."""
@@ -1,13 +1,13 @@
 import os
-import time
-import concurrent.futures
+import pandas as pd
 import yfinance as yf
-from datetime import datetime, timedelta
+from datetime import date, datetime
 
 # Constants
 _INPUT_FILE = "all_dividend_symbols.txt"
 _OUTPUT_DIR = "daily_stocks_price"
-_MAX_WORKERS = 1
+_MAX_WORKERS = 16
+_BATCH_SIZE = 100
 _YEARS_HISTORY = "15y"
 
 def _get_symbols() -> list[str]:
@@ -15,50 +15,77 @@ def _get_symbols() -> list[str]:
     if not os.path.exists(_INPUT_FILE):
         print(f"Error: {_INPUT_FILE} not found.")
         return []
-    
+
     with open(_INPUT_FILE, "r") as f:
-        return [line.strip() for line in f if line.strip()]
+        # Lines are in "Symbol,Sector" format
+        return [line.split(",")[0].strip() for line in f if line.strip()]
+
+def _get_saved_dates() -> dict[str, date]:
+    """Maps each symbol with saved prices to the date its file was last written."""
+    with os.scandir(_OUTPUT_DIR) as entries:
+        return {
+            os.path.splitext(entry.name)[0]: datetime.fromtimestamp(entry.stat().st_mtime).date()
+            for entry in entries
+            if entry.name.endswith(".csv")
+        }
 
-def _fetch_prices(symbol: str) -> None:
-    """Fetches daily prices for a symbol using yfinance and saves to CSV."""
+def _write_prices(symbol: str, hist: pd.DataFrame) -> None:
+    """Saves the daily prices of a symbol to CSV."""
     output_path = os.path.join(_OUTPUT_DIR, f"{symbol}.csv")
-    
+
+    # Select required columns: Low, High, Close, Volume
+    hist = hist[["Low", "High", "Close", "Volume"]].dropna(how="all")
+    if hist.empty:
+        print(f"Warning: No data found for {symbol}")
+        return
+
+    # Batch downloads align all symbols on the same dates, which turns volumes into floats
+    hist = hist.assign(Volume=hist["Volume"].round().astype("Int64"))
+
+    # Remove time from index (keep only date)
+    hist.index = hist.index.date
+
+    # Save to CSV, rounding to 3 decimal places while formatting
+    hist.to_csv(output_path, float_format="%.3f")
+
+def _fetch_batch(symbols: list[str]) -> None:
+    """Fetches daily prices for a batch of symbols with one yfinance download."""
     try:
-        # Fetch history
-        ticker = yf.Ticker(symbol)
-        hist = ticker.history(period=_YEARS_HISTORY)
-        
-        if hist.empty:
-            print(f"Warning: No data found for {symbol}")
-            return
-
-        # Select required columns: Low, High, Close, Volume
-        hist = hist[["Low", "High", "Close", "Volume"]]
-        
-        # Remove time from index (keep only date)
-        hist.index = hist.index.date
-        
-        # Round to 3 decimal places
-        hist = hist.round(3)
-        
-        # Save to CSV
-        hist.to_csv(output_path)
-        
+        data = yf.download(
+            symbols,
+            period=_YEARS_HISTORY,
+            group_by="ticker",
+            auto_adjust=True,
+            threads=_MAX_WORKERS,
+            progress=False,
+        )
     except Exception as e:
-        print(f"Error processing {symbol}: {e}")
+        print(f"Error downloading batch starting at {symbols[0]}: {e}")
+        return
+
+    downloaded = set(data.columns.get_level_values(0))
+    for symbol in symbols:
+        if symbol not in downloaded:
+            print(f"Warning: No data found for {symbol}")
+            continue
+        try:
+            _write_prices(symbol, data[symbol])
+        except Exception as e:
+            print(f"Error processing {symbol}: {e}")
 
 def get_daily_prices() -> None:
-    """Main function to fetch daily prices in parallel."""
-    if not os.path.exists(_OUTPUT_DIR):
-        os.makedirs(_OUTPUT_DIR)
-        
-    symbols = _get_symbols()
+    """Main function to fetch daily prices in batches."""
+    os.makedirs(_OUTPUT_DIR, exist_ok=True)
+
+    # Skip symbols whose prices were already saved today
+    saved_dates = _get_saved_dates()
+    today = datetime.today().date()
+    symbols = [symbol for symbol in _get_symbols() if saved_dates.get(symbol) != today]
     print(f"Fetching daily prices for {len(symbols)} symbols...")
-    
-    with concurrent.futures.ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
-        futures = [executor.submit(_fetch_prices, symbol) for symbol in symbols]
-        concurrent.futures.wait(futures)
-        
+
+    for start in range(0, len(symbols), _BATCH_SIZE):
+        _fetch_batch(symbols[start:start + _BATCH_SIZE])
+
     print("Finished fetching daily prices.")
 
 if __name__ == "__main__":
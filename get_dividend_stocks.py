@@ -1,104 +1,147 @@
+import argparse
+import asyncio
 import csv
-import json
+import io
 import os
-import urllib.request
-import concurrent.futures
-from typing import List, Dict, Any
+import time
+from typing import Any, List, Set, Tuple
+
+import httpx
+from tqdm import tqdm
+
+from build_dividends import build_dividends
+from dividend_rows import FIELDNAMES, extract_dividends
+from http_client import create_client, request_json, run, warm_up
 
 # Constants
-_API_URL_TEMPLATE = "https://api.nasdaq.com/api/quote/{}/dividends?assetclass=stocks"
-_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36"
+_URL_PREFIX = "https://api.nasdaq.com/api/quote/"
+_URL_SUFFIX = "/dividends?assetclass=stocks"
 _INPUT_FILENAME = "all_symbols.csv"
+# Indices (^GSPC) and share classes (BRK/B, BRK.B) have no dividend page of their own
+_INVALID_SYMBOL_CHARS = ("^", ".", "/")
 _OUTPUT_DIR = "dividend_stocks"
-_MAX_WORKERS = 5
+_WRITE_BUFFER_SIZE = 65536
+_FRESHNESS_SECONDS = 24 * 60 * 60
+_MAX_CONCURRENCY = 50
+# HTTP/2 multiplexes many requests over each connection
+_MAX_CONNECTIONS = 10
+
+def _is_valid_symbol(symbol: str) -> bool:
+    """Checks whether a symbol can have a dividend page, skipping blanks and indices."""
+    return bool(symbol) and symbol.isascii() and not any(c in symbol for c in _INVALID_SYMBOL_CHARS)
 
 def _get_symbols() -> List[str]:
     """Reads symbols from the input CSV file."""
-    symbols = []
     if not os.path.exists(_INPUT_FILENAME):
         print(f"Error: {_INPUT_FILENAME} not found.")
-        return symbols
-        
+        return []
+
     with open(_INPUT_FILENAME, "r") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if "Symbol" in row:
-                symbols.append(row["Symbol"])
-    return symbols
+        reader = csv.reader(f)
+        header = next(reader, [])
+        if "Symbol" not in header:
+            return []
+        index = header.index("Symbol")
+        symbols = (row[index].strip().upper() for row in reader if row)
+        # Duplicates would be fetched twice; dict.fromkeys keeps the file order
+        return list(dict.fromkeys(symbol for symbol in symbols if _is_valid_symbol(symbol)))
 
-def _fetch_dividend_data(symbol: str) -> List[Dict[str, str]]:
+def _get_fresh_symbols() -> Set[str]:
+    """Returns the symbols whose dividend file was written within the freshness window."""
+    cutoff = time.time() - _FRESHNESS_SECONDS
+    with os.scandir(_OUTPUT_DIR) as entries:
+        return {
+            os.path.splitext(entry.name)[0]
+            for entry in entries
+            if entry.name.endswith(".csv") and entry.stat().st_mtime > cutoff
+        }
+
+async def _fetch_dividend_data(
+    client: httpx.AsyncClient, semaphore: asyncio.Semaphore, symbol: str
+) -> List[Tuple[Any, ...]]:
     """Fetches dividend data for a single symbol."""
-    url = _API_URL_TEMPLATE.format(symbol)
-    headers = {"User-Agent": _USER_AGENT}
-    req = urllib.request.Request(url, headers=headers)
-    
+    url = _URL_PREFIX + symbol + _URL_SUFFIX
+
     try:
-        with urllib.request.urlopen(req) as response:
-            data = json.loads(response.read())
-            return _extract_dividends(data)
-    except Exception as e:
-        print(f"Error fetching data for {symbol}: {e}")
+        async with semaphore:
+            data = await request_json(client, url)
+        return extract_dividends(data)
+    except (httpx.HTTPError, ValueError) as e:
+        tqdm.write(f"Error fetching data for {symbol}: {e}")
         return []
 
-def _extract_dividends(data: Dict[str, Any]) -> List[Dict[str, str]]:
-    """Extracts dividend information from the API response."""
-    dividends = []
-    if not data or "data" not in data or not data["data"]:
-        return dividends
-        
-    dividend_data = data["data"].get("dividends", {})
-    if not dividend_data:
-        return dividends
-
-    rows = dividend_data.get("rows", [])
-    if not rows:
-        return dividends
-
-    for row in rows:
-        dividends.append({
-            "Ex-Dividend Date": row.get("exOrEffDate", "N/A"),
-            "Type": row.get("type", "N/A"),
-            "Amount": row.get("amount", "N/A"),
-            "Declaration Date": row.get("declarationDate", "N/A"),
-            "Record Date": row.get("recordDate", "N/A"),
-            "Payment Date": row.get("paymentDate", "N/A"),
-            "Currency": row.get("currency", "N/A")
-        })
-    return dividends
-
-def _write_dividend_csv(symbol: str, dividends: List[Dict[str, str]]) -> None:
+def _write_dividend_csv(symbol: str, dividends: List[Tuple[Any, ...]]) -> None:
     """Writes dividend data to a CSV file."""
     filepath = os.path.join(_OUTPUT_DIR, f"{symbol}.csv")
-    
-    fieldnames = ["Ex-Dividend Date", "Type", "Amount", "Declaration Date", "Record Date", "Payment Date", "Currency"]
-    
+
+    # Build the file in memory so it reaches the disk in a single write
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(FIELDNAMES)
+    writer.writerows(dividends)
+
     try:
-        with open(filepath, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            if dividends:
-                writer.writerows(dividends)
-    except Exception as e:
-        print(f"Error writing CSV for {symbol}: {e}")
-
-def _process_stock(symbol: str) -> None:
+        with open(filepath, "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(buffer.getvalue())
+    except OSError as e:
+        tqdm.write(f"Error writing CSV for {symbol}: {e}")
+
+async def _process_stock(
+    client: httpx.AsyncClient, semaphore: asyncio.Semaphore, symbol: str
+) -> None:
     """Orchestrates fetching and writing for a single stock."""
-    print(f"Processing {symbol}...")
-    dividends = _fetch_dividend_data(symbol)
-    _write_dividend_csv(symbol, dividends)
-
-def get_dividend_stocks() -> None:
-    """Main function to fetch dividend stocks in parallel."""
-    if not os.path.exists(_OUTPUT_DIR):
-        os.makedirs(_OUTPUT_DIR)
+    dividends = await _fetch_dividend_data(client, semaphore, symbol)
+    # Non-payers and failed fetches get no file at all
+    if not dividends:
+        return
+    # Disk writes run in a worker thread so they never block the event loop
+    await asyncio.to_thread(_write_dividend_csv, symbol, dividends)
+
+def _report_failure(task: asyncio.Task) -> None:
+    """Prints the error of a finished stock task, if it failed."""
+    error = task.exception()
+    if error is not None:
+        tqdm.write(f"Error processing {task.get_name()}: {error}")
+
+async def _process_stocks(symbols: List[str]) -> None:
+    """Processes all stocks concurrently over one pooled HTTP/2 client."""
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENCY)
+    async with create_client(_MAX_CONNECTIONS, http2=True) as client:
+        await warm_up(client, _URL_PREFIX)
+        pending = {
+            asyncio.create_task(_process_stock(client, semaphore, symbol), name=symbol)
+            for symbol in symbols
+        }
+        # Handle stocks in completion order so a failure never holds up the rest
+        with tqdm(total=len(symbols), unit="symbol") as progress:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    _report_failure(task)
+                progress.update(len(done))
+
+def get_dividend_stocks(force: bool = False) -> None:
+    """
+    Main function to fetch dividend stocks concurrently.
+
+    Args:
+        force: Refetch symbols whose file is less than 24 hours old.
+    """
+    os.makedirs(_OUTPUT_DIR, exist_ok=True)
         
     symbols = _get_symbols()
+    if not force:
+        fresh_symbols = _get_fresh_symbols()
+        symbols = [symbol for symbol in symbols if symbol not in fresh_symbols]
     print(f"Found {len(symbols)} symbols to process.")
     
-    with concurrent.futures.ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
-        executor.map(_process_stock, symbols)
-    
+    run(_process_stocks(symbols))
     print("Finished processing all stocks.")
 
+    # Refresh the consolidated file once, rather than per symbol
+    build_dividends()
+
 if __name__ == "__main__":
-    get_dividend_stocks()
+    parser = argparse.ArgumentParser(description="Fetch the dividend history of all symbols.")
+    parser.add_argument("--force", action="store_true", help="refetch symbols updated in the last 24 hours")
+    get_dividend_stocks(force=parser.parse_args().force)
@@ -1,11 +1,13 @@
 from get_all_stocks import get_all_stocks
 from get_dividend_stocks import get_dividend_stocks
 from filter_dividend_stocks import filter_dividend_stocks
+from build_dividends import build_dividends
 from get_daily_prices import get_daily_prices
 
 if __name__ == "__main__":
     #get_all_stocks()
     #get_dividend_stocks()
     #filter_dividend_stocks()
+    #build_dividends()
     #get_daily_prices()
     print("Done.")
@@ -0,0 +1,41 @@
+import numpy as np
+from numba import njit, prange
+
+@njit(parallel=True, cache=True)
+def consistent_yearly_counts(starts: np.ndarray, years: np.ndarray) -> np.ndarray:
+    """
+    Computes the consistent yearly dividend count of each symbol.
+
+    Args:
+        starts: Offsets of each symbol's block in `years`, followed by its length.
+        years: Dividend years, sorted within each symbol block.
+
+    Returns:
+        The dividend count shared by every year except the first and last
+        of each symbol, or -1 when there is none.
+    """
+    n_symbols = len(starts) - 1
+    counts = np.full(n_symbols, -1, np.int32)
+    for i in prange(n_symbols):
+        start, end = starts[i], starts[i + 1]
+        # Drop the first and last year, which may be incomplete
+        inner_start = start
+        while inner_start < end and years[inner_start] == years[start]:
+            inner_start += 1
+        inner_end = end
+        while inner_end > inner_start and years[inner_end - 1] == years[end - 1]:
+            inner_end -= 1
+
+        count = -1
+        j = inner_start
+        while j < inner_end:
+            k = j
+            while k < inner_end and years[k] == years[j]:
+                k += 1
+            if count != -1 and k - j != count:
+                count = -1
+                break
+            count = k - j
+            j = k
+        counts[i] = count
+    return counts